@@ -15,3 +15,9 @@ def normalize_capture_set(capture: CaptureSet | None) -> dict[str, str]:
         case _:
             raise TypeError("Invalid capture set")
     return capture
+
+
+def normalize_capture_sets(*captures: CaptureSet | None) -> tuple[dict[str, str], ...]:
+    """Makes sure all capture sets are dicts"""
+
+    return tuple(normalize_capture_set(c) for c in captures)
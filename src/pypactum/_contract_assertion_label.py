@@ -5,12 +5,15 @@ from pypactum._evaluation_semantic import EvaluationSemantic
 from pypactum._assertion_kind import AssertionKind
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContractAssertionInfo:
-    """Bundles information about a contract assertion relevant to contract assertion labels"""
+    """Bundles information about a contract assertion relevant to contract assertion labels
+
+    Instances are immutable and shared between all assertions of the same kind in the same module.
+    """
 
     kind: AssertionKind
-    module_name: str
+    module_name: str  # Name of the module the assertion is declared in, or an empty string if unknown
 
 
 type ContractAssertionLabel = Callable[
@@ -8,7 +8,12 @@ from pypactum._evaluation_semantic import EvaluationSemantic
 class ContractViolation:
     """Holds information about a contract violation"""
 
-    __kind_strings = [None, "Precondition", "Postcondition", "Assertion"]
+    __slots__ = ("comment", "kind", "location", "semantic", "kwargs")
+
+    __kind_strings = {
+        AssertionKind.pre: "Precondition",
+        AssertionKind.post: "Postcondition",
+    }
 
     def __init__(
         self,
@@ -25,20 +30,13 @@ class ContractViolation:
         self.kwargs = kwargs
 
     def __str__(self) -> str:
-        kind = ContractViolation.__kind_strings[self.kind.value]
-        loc = (
-            f"{self.location.filename}:{self.location.lineno}"
-            if self.location is not None
-            else ""
-        )
+        kind = ContractViolation.__kind_strings[self.kind]
+        loc, context = "", ""
+        if self.location is not None:
+            loc = f"{self.location.filename}:{self.location.lineno}"
+            if self.location.code_context:
+                context = f"\nContext:\n{'\n'.join(self.location.code_context)}"
         diagnostic = f"{kind} violation at {loc}"
-        if len(self.comment) > 0:
+        if self.comment:
             diagnostic += f": {self.comment}"
-        diagnostic += f"\nVariables: {self.kwargs}"
-        if (
-            self.location is not None
-            and self.location.code_context is not None
-            and len(self.location.code_context) > 0
-        ):
-            diagnostic += f"\nContext:\n{'\n'.join(self.location.code_context)}"
-        return diagnostic
+        return f"{diagnostic}\nVariables: {self.kwargs}{context}"
@@ -1,18 +1,21 @@
 import inspect
+import sys
 from types import TracebackType
 from typing import Self, Literal, Any
 
 from pypactum._pre import pre
 from pypactum._post import post, PostconditionScope
 from pypactum._predicate import Predicate
-from pypactum._capture_set import CaptureSet, normalize_capture_set
+from pypactum._capture_set import CaptureSet, normalize_capture_sets
 from pypactum._contract_assertion_label import ContractAssertionLabel
-from pypactum._utils._parent_frame import get_parent_frame
+from pypactum._utils._parent_frame import get_frame_position
 
 
 class invariant:
     """Invariant assertion factory taking a predicate to evaluate before and after member method evaluation"""
 
+    __slots__ = ("__pre", "__post")
+
     __methods_to_ignore = [
         # runs before the object is initialized and therefore can't maintain any invariants
         "__new__",
@@ -43,8 +46,7 @@ class invariant:
             clone: A set of names to clone. Variables by this name can be predicate parameters.
             labels: A list of labels that determine this assertion's evaluation semantic
         """
-        capture = normalize_capture_set(capture)
-        clone = normalize_capture_set(clone)
+        capture, clone = normalize_capture_sets(capture, clone)
 
         if labels is None:
             labels = []
@@ -63,9 +65,12 @@ class invariant:
             scope=PostconditionScope.Always,
         )
         # Hacky! Patch up internal parent frame to point to the correct parent, instead of this __init__ method
-        parent_frame = get_parent_frame(inspect.currentframe())
+        parent_frame = sys._getframe(1)
+        loc = get_frame_position(parent_frame)
         setattr(self.__pre, "_pre__parent_frame", parent_frame)
+        setattr(self.__pre, "_pre__loc", loc)
         setattr(self.__post, "_post__parent_frame", parent_frame)
+        setattr(self.__post, "_post__loc", loc)
 
     def __call__[T](self, cls: type[T], /) -> type[T]:
         """Wraps the given class that checks invariants before and after evaluation of all member methods
@@ -1,4 +1,5 @@
 import inspect
+import sys
 from collections.abc import Callable
 from enum import Enum, Flag, auto
 from functools import wraps
@@ -9,14 +10,15 @@ from pypactum._evaluation_semantic import EvaluationSemantic
 from pypactum._assertion_kind import AssertionKind
 from pypactum._utils._assert_contract import assert_contract
 from pypactum._utils._effective_semantic import effective_semantic
-from pypactum._utils._map_function_arguments import map_function_arguments
-from pypactum._utils._parent_frame import get_parent_frame
+from pypactum._utils._generate_binder import generate_binder
+from pypactum._utils._parameter_names import parameter_names
+from pypactum._utils._parent_frame import get_frame_position
 from pypactum._utils._resolve_bindings import (
     resolve_bindings,
     collect_available_variables,
 )
 from pypactum._predicate import Predicate
-from pypactum._capture_set import CaptureSet, normalize_capture_set
+from pypactum._capture_set import CaptureSet, normalize_capture_sets
 from pypactum._contract_assertion_label import ContractAssertionLabel
 
 
@@ -31,6 +33,21 @@ class PostconditionScope(Flag):
 class post:
     """Postcondition assertion factory taking a predicate to evaluate after function evaluation"""
 
+    __slots__ = (
+        "__predicate",
+        "__pred_params",
+        "__capture_before",
+        "__capture_after",
+        "__clone_before",
+        "__clone_after",
+        "__bindings",
+        "__scope",
+        "__parent_frame",
+        "__semantic",
+        "__loc",
+        "__resolved_kwargs",
+    )
+
     def __init__(
         self,
         predicate: Predicate,
@@ -55,10 +72,11 @@ class post:
             scope: Determines whether the postcondition applies if the function returns regularly, with an exception, or both
         """
 
-        capture_before = normalize_capture_set(capture_before)
-        capture_after = normalize_capture_set(capture_after)
-        clone_before = normalize_capture_set(clone_before)
-        clone_after = normalize_capture_set(clone_after)
+        capture_before, capture_after, clone_before, clone_after = (
+            normalize_capture_sets(
+                capture_before, capture_after, clone_before, clone_after
+            )
+        )
 
         if labels is None:
             labels = []
@@ -69,10 +87,22 @@ class post:
         self.__clone_before = clone_before
         self.__clone_after = clone_after
         self.__scope = scope
-        self.__parent_frame = get_parent_frame(inspect.currentframe())
+        self.__parent_frame = sys._getframe(1)
         self.__semantic = effective_semantic(
             self.__parent_frame, AssertionKind.post, labels
         )
+        self.__resolved_kwargs: dict[str, Any] = {}
+        # Ignored assertions are never evaluated, so skip introspecting the predicate and locating the assertion
+        if self.__semantic is EvaluationSemantic.ignore:
+            self.__pred_params: frozenset[str] = frozenset()
+            self.__bindings: frozenset[str] = frozenset()
+            self.__loc = None
+            return
+        self.__pred_params = frozenset(parameter_names(predicate))
+        self.__bindings = frozenset().union(
+            capture_before, capture_after, clone_before, clone_after
+        )
+        self.__loc = get_frame_position(self.__parent_frame)
 
     def __find_result_param(self) -> str | None:
         """Given the predicate parameters `pred_params`, finds the one not in the set of bound names `bindings`.
@@ -82,23 +112,57 @@ class post:
         Raises `TypeError` if there is more than one potential result parameter.
         """
 
-        bindings = (
-            set(self.__capture_before.keys())
-            | set(self.__clone_before.keys())
-            | set(self.__capture_after.keys())
-            | set(self.__clone_after.keys())
-        )
-        params = inspect.signature(self.__predicate).parameters
-        candidates = {n for n in params.keys() if n not in bindings}
-        match len(candidates):
-            case 0:
-                return None
-            case 1:
-                return candidates.pop()
-            case _:
+        bindings = self.__bindings
+        found = None
+        for n in self.__pred_params:
+            if n in bindings:
+                continue
+            if found is not None:
+                candidates = [n for n in self.__pred_params if n not in bindings]
                 raise TypeError(
                     f"Unable to determine predicate result parameter. Candidates: {','.join(candidates)}"
                 )
+            found = n
+        return found
+
+    def __generate_bind_after(
+        self,
+        sig: inspect.Signature,
+        qualname: str,
+        implicit_return_capture: bool,
+    ) -> Callable[..., dict[str, Any]] | None:
+        """Generates the binder for "after"-type bindings, which takes the result as additional first argument.
+
+        If the result parameter can't be determined, the returned binder raises `TypeError` when called. If there are
+        no "after"-type bindings at all, returns None.
+        """
+
+        # Implicitly capture result argument
+        capture_after = self.__capture_after
+        result_name = None
+        if implicit_return_capture:
+            try:
+                result_name = self.__find_result_param()
+            except TypeError as error:
+                message = str(error)
+
+                def raise_error(*args: Any, **kwargs: Any) -> dict[str, Any]:
+                    raise TypeError(message)
+
+                return raise_error
+            if result_name is not None:
+                capture_after = {result_name: result_name} | capture_after
+        if not capture_after and not self.__clone_after:
+            return None
+        return generate_binder(
+            sig,
+            capture=capture_after,
+            clone=self.__clone_after,
+            parent_frame=self.__parent_frame,
+            qualname=qualname,
+            with_result=True,
+            result_name=result_name,
+        )
 
     def __call__[R](
         self,
@@ -118,65 +182,74 @@ class post:
             - a checked wrapper compatible with `func` otherwise
         """
 
-        if self.__semantic == EvaluationSemantic.ignore:
+        if self.__semantic is EvaluationSemantic.ignore:
             return func
 
-        @wraps(func)
-        def checked_func(*args: Any, **kwargs: Any) -> R:
+        try:
             sig = inspect.signature(func)
-            nkwargs = map_function_arguments(sig, args, kwargs)
+        except ValueError as error:
+            # Callables without a signature, e.g. builtin methods inherited by an invariant class, only fail when called
+            message = str(error)
+
+            @wraps(func)
+            def raise_error(*args: Any, **kwargs: Any) -> R:
+                raise ValueError(message)
+
+            return raise_error
+        qualname = getattr(func, "__qualname__", "checked_func")
+        pred_params = self.__pred_params
+        # Implicitly capture function arguments the predicate refers to, but explicit captures take priority
+        capture_before = self.__capture_before
+        if _implicit_arg_capture:
+            capture_before = {
+                n: n for n in sig.parameters.keys() if n in pred_params
+            } | capture_before
+        bind_before = generate_binder(
+            sig,
+            capture=capture_before,
+            clone=self.__clone_before,
+            parent_frame=self.__parent_frame,
+            qualname=qualname,
+        )
+        bind_after = self.__generate_bind_after(sig, qualname, _implicit_return_capture)
+        predicate = self.__predicate
+        semantic = self.__semantic
+        # Flag membership tests are comparatively slow, so decide them once
+        check_regular = PostconditionScope.RegularReturn in self.__scope
+        check_exceptional = PostconditionScope.ExceptionalReturn in self.__scope
+        loc = self.__loc
+        # If every binding is a predicate parameter, there's nothing to filter out on each call
+        bound_params = None if self.__bindings <= pred_params else pred_params
 
+        @wraps(func)
+        def checked_func(*args: Any, **kwargs: Any) -> R:
             # resolve "before"-type bindings
-            available_variables = collect_available_variables(
-                self.__parent_frame,
-                nkwargs,
-            )
-            capture = self.__capture_before
-            if _implicit_arg_capture:
-                capture = {n: n for n in sig.parameters.keys()} | capture
-            resolved_kwargs = resolve_bindings(
-                available_variables=available_variables,
-                capture=capture,
-                clone=self.__clone_before,
-            )
+            resolved_kwargs = bind_before(*args, **kwargs)
 
             # evaluate decorated function
             exception_raised = None
             try:
                 result = func(*args, **kwargs)
             except Exception as exc:
-                if PostconditionScope.ExceptionalReturn not in self.__scope:
+                if not check_exceptional:
                     raise
                 exception_raised = exc
             else:
-                if PostconditionScope.RegularReturn not in self.__scope:
+                if not check_regular:
                     return result
 
             # resolve "after"-type bindings
-            available_variables = collect_available_variables(
-                self.__parent_frame,
-                nkwargs,
-            )
-            # Implicitly capture result argument
-            capture = self.__capture_after
-            if _implicit_return_capture:
-                result_name = self.__find_result_param()
+            if bind_after is not None:
                 result_value = result if exception_raised is None else exception_raised
-                if result_name is not None:
-                    capture = {result_name: result_name} | capture
-                    available_variables.insert(0, {result_name: result_value})
-            resolved_kwargs |= resolve_bindings(
-                available_variables=available_variables,
-                capture=capture,
-                clone=self.__clone_after,
-            )
+                resolved_kwargs |= bind_after(result_value, *args, **kwargs)
 
             # assert postcondition
             assert_contract(
-                semantic=self.__semantic,
+                semantic=semantic,
                 kind=AssertionKind.post,
-                calling_frame=self.__parent_frame,
-                predicate=self.__predicate,
+                location=loc,
+                predicate=predicate,
+                predicate_params=bound_params,
                 predicate_kwargs=resolved_kwargs,
             )
 
@@ -186,18 +259,27 @@ class post:
             else:
                 return result
 
+        # Let signature lookups, e.g. of stacked contracts, stop here instead of unwrapping
+        setattr(checked_func, "__signature__", sig)
         return checked_func
 
     def __enter__(self) -> Self:
         """Captures before-type bindings when the scope is entered"""
 
-        # resolve "before"-type bindings
-        available_variables = collect_available_variables(self.__parent_frame, {})
-        self.__resolved_kwargs = resolve_bindings(
-            available_variables=available_variables,
-            capture=self.__capture_before,
-            clone=self.__clone_before,
-        )
+        if self.__semantic is EvaluationSemantic.ignore:
+            return self
+
+        # resolve "before"-type bindings, without touching the frame if there are none
+        resolved_kwargs: dict[str, Any] = {}
+        if self.__capture_before or self.__clone_before:
+            available_variables = collect_available_variables(self.__parent_frame, {})
+            resolve_bindings(
+                resolved_kwargs,
+                available_variables=available_variables,
+                capture=self.__capture_before,
+                clone=self.__clone_before,
+            )
+        self.__resolved_kwargs = resolved_kwargs
         return self
 
     def __exit__(
@@ -208,6 +290,13 @@ class post:
     ) -> Literal[False]:
         """Captures after-type bindings, then checks the postcondition"""
 
+        # Don't keep the "before"-type bindings alive beyond the scope
+        resolved_kwargs = self.__resolved_kwargs
+        self.__resolved_kwargs = {}
+
+        if self.__semantic is EvaluationSemantic.ignore:
+            return False
+
         exceptional_exit = exc_val is not None
         if exceptional_exit:
             if PostconditionScope.ExceptionalReturn not in self.__scope:
@@ -216,20 +305,23 @@ class post:
             if PostconditionScope.RegularReturn not in self.__scope:
                 return False
 
-        # resolve "after"-type bindings
-        available_variables = collect_available_variables(self.__parent_frame, {})
-        self.__resolved_kwargs |= resolve_bindings(
-            available_variables=available_variables,
-            capture=self.__capture_after,
-            clone=self.__clone_after,
-        )
+        # resolve "after"-type bindings, without touching the frame if there are none
+        if self.__capture_after or self.__clone_after:
+            available_variables = collect_available_variables(self.__parent_frame, {})
+            resolve_bindings(
+                resolved_kwargs,
+                available_variables=available_variables,
+                capture=self.__capture_after,
+                clone=self.__clone_after,
+            )
 
         # assert postcondition
         assert_contract(
             semantic=self.__semantic,
             kind=AssertionKind.post,
-            calling_frame=self.__parent_frame,
+            location=self.__loc,
             predicate=self.__predicate,
-            predicate_kwargs=self.__resolved_kwargs,
+            predicate_params=self.__pred_params,
+            predicate_kwargs=resolved_kwargs,
         )
         return False
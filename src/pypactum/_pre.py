@@ -1,4 +1,5 @@
 import inspect
+import sys
 from collections.abc import Callable
 from functools import wraps
 from types import TracebackType
@@ -6,22 +7,39 @@ from typing import Any, Self, Literal
 
 from pypactum._evaluation_semantic import EvaluationSemantic
 from pypactum._assertion_kind import AssertionKind
-from pypactum._utils._assert_contract import assert_contract
+from pypactum._utils._assert_contract import (
+    assert_contract,
+    assert_contract_positional,
+)
 from pypactum._utils._effective_semantic import effective_semantic
-from pypactum._utils._map_function_arguments import map_function_arguments
-from pypactum._utils._parent_frame import get_parent_frame
+from pypactum._utils._generate_binder import generate_binder
+from pypactum._utils._parameter_names import (
+    parameter_names,
+    positional_parameter_names,
+)
+from pypactum._utils._parent_frame import get_frame_position
 from pypactum._utils._resolve_bindings import (
     resolve_bindings,
     collect_available_variables,
 )
 from pypactum._predicate import Predicate
-from pypactum._capture_set import CaptureSet, normalize_capture_set
+from pypactum._capture_set import CaptureSet, normalize_capture_sets
 from pypactum._contract_assertion_label import ContractAssertionLabel
 
 
 class pre:
     """Precondition assertion factory taking a predicate to evaluate on function evaluation"""
 
+    __slots__ = (
+        "__predicate",
+        "__pred_params",
+        "__capture",
+        "__clone",
+        "__parent_frame",
+        "__semantic",
+        "__loc",
+    )
+
     def __init__(
         self,
         predicate: Predicate,
@@ -40,8 +58,7 @@ class pre:
             clone: A set of names to clone. Variables by this name can be predicate parameters.
             labels: A list of labels that determine this assertion's evaluation semantic
         """
-        capture = normalize_capture_set(capture)
-        clone = normalize_capture_set(clone)
+        capture, clone = normalize_capture_sets(capture, clone)
 
         if labels is None:
             labels = []
@@ -49,10 +66,17 @@ class pre:
         self.__predicate = predicate
         self.__capture = capture
         self.__clone = clone
-        self.__parent_frame = get_parent_frame(inspect.currentframe())
+        self.__parent_frame = sys._getframe(1)
         self.__semantic = effective_semantic(
             self.__parent_frame, AssertionKind.pre, labels
         )
+        # Ignored assertions are never evaluated, so skip introspecting the predicate and locating the assertion
+        if self.__semantic is EvaluationSemantic.ignore:
+            self.__pred_params: frozenset[str] = frozenset()
+            self.__loc = None
+            return
+        self.__pred_params = frozenset(parameter_names(predicate))
+        self.__loc = get_frame_position(self.__parent_frame)
 
     def __call__[R](
         self,
@@ -71,60 +95,123 @@ class pre:
             - a checked wrapper compatible with `func` otherwise
         """
 
-        if self.__semantic == EvaluationSemantic.ignore:
+        if self.__semantic is EvaluationSemantic.ignore:
             return func
 
-        @wraps(func)
-        def checked_func(*args: Any, **kwargs: Any) -> R:
+        try:
             sig = inspect.signature(func)
-            nkwargs = map_function_arguments(sig, args, kwargs)
-
-            # resolve bindings
-            available_variables = collect_available_variables(
-                self.__parent_frame,
-                nkwargs,
-            )
-            # Implicitly capture function arguments, but explicit captures take priority
-            capture = self.__capture
-            if _implicit_arg_capture:
-                capture = {n: n for n in sig.parameters.keys()} | capture
-            resolved_kwargs = resolve_bindings(
-                available_variables=available_variables,
+        except ValueError as error:
+            # Callables without a signature, e.g. builtin methods inherited by an invariant class, only fail when called
+            message = str(error)
+
+            @wraps(func)
+            def raise_error(*args: Any, **kwargs: Any) -> R:
+                raise ValueError(message)
+
+            return raise_error
+        pred_params = self.__pred_params
+        # Implicitly capture function arguments the predicate refers to, but explicit captures take priority
+        capture = self.__capture
+        if _implicit_arg_capture:
+            capture = {
+                n: n for n in sig.parameters.keys() if n in pred_params
+            } | capture
+        predicate = self.__predicate
+        semantic = self.__semantic
+        loc = self.__loc
+        qualname = getattr(func, "__qualname__", "checked_func")
+
+        # If the bindings are exactly the predicate parameters, and they can all be passed positionally, do so. This
+        # avoids building a dict and matching keyword arguments on each call.
+        positional = positional_parameter_names(predicate)
+        if positional is not None and capture.keys() | self.__clone.keys() == set(
+            positional
+        ):
+            bind_args = generate_binder(
+                sig,
                 capture=capture,
                 clone=self.__clone,
+                parent_frame=self.__parent_frame,
+                qualname=qualname,
+                positional=positional,
             )
 
+            @wraps(func)
+            def checked_func_positional(*args: Any, **kwargs: Any) -> R:
+                # assert precondition
+                assert_contract_positional(
+                    semantic=semantic,
+                    kind=AssertionKind.pre,
+                    location=loc,
+                    predicate=predicate,
+                    predicate_params=positional,
+                    predicate_args=bind_args(*args, **kwargs),
+                )
+
+                # evaluate decorated function
+                return func(*args, **kwargs)
+
+            # Let signature lookups, e.g. of stacked contracts, stop here instead of unwrapping
+            setattr(checked_func_positional, "__signature__", sig)
+            return checked_func_positional
+
+        bind = generate_binder(
+            sig,
+            capture=capture,
+            clone=self.__clone,
+            parent_frame=self.__parent_frame,
+            qualname=qualname,
+        )
+        # If every binding is a predicate parameter, there's nothing to filter out on each call
+        bound_params = (
+            None
+            if capture.keys() <= pred_params and self.__clone.keys() <= pred_params
+            else pred_params
+        )
+
+        @wraps(func)
+        def checked_func(*args: Any, **kwargs: Any) -> R:
             # assert precondition
             assert_contract(
-                semantic=self.__semantic,
+                semantic=semantic,
                 kind=AssertionKind.pre,
-                calling_frame=self.__parent_frame,
-                predicate=self.__predicate,
-                predicate_kwargs=resolved_kwargs,
+                location=loc,
+                predicate=predicate,
+                predicate_params=bound_params,
+                predicate_kwargs=bind(*args, **kwargs),
             )
 
             # evaluate decorated function
             return func(*args, **kwargs)
 
+        # Let signature lookups, e.g. of stacked contracts, stop here instead of unwrapping
+        setattr(checked_func, "__signature__", sig)
         return checked_func
 
     def __enter__(self) -> Self:
         """Checks all preconditions when the scope is entered"""
 
-        # resolve bindings
-        available_variables = collect_available_variables(self.__parent_frame, {})
-        resolved_kwargs = resolve_bindings(
-            available_variables=available_variables,
-            capture=self.__capture,
-            clone=self.__clone,
-        )
+        if self.__semantic is EvaluationSemantic.ignore:
+            return self
+
+        # resolve bindings, without touching the frame if there are none
+        resolved_kwargs: dict[str, Any] = {}
+        if self.__capture or self.__clone:
+            available_variables = collect_available_variables(self.__parent_frame, {})
+            resolve_bindings(
+                resolved_kwargs,
+                available_variables=available_variables,
+                capture=self.__capture,
+                clone=self.__clone,
+            )
 
         # assert precondition
         assert_contract(
             semantic=self.__semantic,
             kind=AssertionKind.pre,
-            calling_frame=self.__parent_frame,
+            location=self.__loc,
             predicate=self.__predicate,
+            predicate_params=self.__pred_params,
             predicate_kwargs=resolved_kwargs,
         )
         return self
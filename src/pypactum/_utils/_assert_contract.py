@@ -1,60 +1,79 @@
-import inspect
-from types import FrameType
+from collections.abc import Collection, Sequence
 from typing import Any
 from pypactum._evaluation_semantic import EvaluationSemantic
 from pypactum._assertion_kind import AssertionKind
 from pypactum._contract_violation import ContractViolation
 from pypactum._contract_violation_handler import invoke_contract_violation_handler
 from pypactum._predicate import Predicate
+from pypactum._utils._parent_frame import FramePosition, get_frame_location
 
 
 def __handle_contract_violation(
     semantic: EvaluationSemantic,
     kind: AssertionKind,
-    location: inspect.Traceback | None,
+    location: FramePosition | None,
     kwargs: dict[str, Any],
     comment: str = "",
 ) -> None:
     """Handles a contract violation by invoking the contract violation handler and/or terminating if required"""
 
+    if semantic is not EvaluationSemantic.check:
+        return
+
     violation = ContractViolation(
         comment=comment,
         kind=kind,
-        location=location,
+        location=get_frame_location(location),
         semantic=semantic,
         kwargs=kwargs,
     )
-
-    if semantic == EvaluationSemantic.check:
-        invoke_contract_violation_handler(violation)
+    invoke_contract_violation_handler(violation)
 
 
 def assert_contract(
     semantic: EvaluationSemantic,
     kind: AssertionKind,
-    calling_frame: FrameType | None,
+    location: FramePosition | None,
     predicate: Predicate,
+    predicate_params: Collection[str] | None,
     predicate_kwargs: dict[str, Any],
 ) -> None:
-    """Evaluates the given predicate and handles a contract violation if the result was false"""
+    """Evaluates the given predicate and handles a contract violation if the result was false
+
+    Only the entries of `predicate_kwargs` named in `predicate_params` are passed to the predicate. If
+    `predicate_params` is None, `predicate_kwargs` is known to hold only predicate parameters and is passed as-is.
+
+    Ignored assertions are never evaluated, so `semantic` must not be `ignore`.
+    """
 
-    if semantic == EvaluationSemantic.ignore:
+    kwargs = predicate_kwargs
+    if predicate_params is not None:
+        kwargs = {k: v for k, v in kwargs.items() if k in predicate_params}
+    if predicate(**kwargs):
         return
+    __handle_contract_violation(
+        semantic=semantic,
+        kind=kind,
+        location=location,
+        kwargs=kwargs,
+    )
 
-    kwargs = {
-        k: v
-        for k, v in predicate_kwargs.items()
-        if k in inspect.signature(predicate).parameters
-    }
-    pred_result = predicate(**kwargs)
-    if not pred_result:
-        __handle_contract_violation(
-            semantic=semantic,
-            kind=kind,
-            location=(
-                inspect.getframeinfo(calling_frame)
-                if calling_frame is not None
-                else None
-            ),
-            kwargs=kwargs,
-        )
+
+def assert_contract_positional(
+    semantic: EvaluationSemantic,
+    kind: AssertionKind,
+    location: FramePosition | None,
+    predicate: Predicate,
+    predicate_params: Sequence[str],
+    predicate_args: tuple[Any, ...],
+) -> None:
+    """Like `assert_contract`, but passes `predicate_args` positionally. They must match `predicate_params` in order."""
+
+    if predicate(*predicate_args):
+        return
+    __handle_contract_violation(
+        semantic=semantic,
+        kind=kind,
+        location=location,
+        kwargs=dict(zip(predicate_params, predicate_args)),
+    )
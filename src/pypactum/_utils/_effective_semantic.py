@@ -1,4 +1,4 @@
-import inspect
+import sys
 from types import FrameType
 
 from pypactum._contract_violation_handler import get_contract_evaluation_semantic
@@ -9,6 +9,31 @@ from pypactum._contract_assertion_label import (
 )
 from pypactum._evaluation_semantic import EvaluationSemantic
 
+__assertion_infos: dict[tuple[AssertionKind, str], ContractAssertionInfo] = {}
+
+
+def __module_name(parent_frame: FrameType | None) -> str:
+    """Returns the name of the module `parent_frame` belongs to, or an empty string if it can't be determined"""
+
+    if parent_frame is None:
+        return ""
+    name = parent_frame.f_globals.get("__name__")
+    if name not in sys.modules:
+        return ""
+    return str(name)
+
+
+def __assertion_info(kind: AssertionKind, module_name: str) -> ContractAssertionInfo:
+    """Returns the interned assertion info for `kind` and `module_name`"""
+
+    key = (kind, module_name)
+    info = __assertion_infos.get(key)
+    if info is None:
+        info = __assertion_infos[key] = ContractAssertionInfo(
+            kind=kind, module_name=module_name
+        )
+    return info
+
 
 def effective_semantic(
     parent_frame: FrameType | None,
@@ -17,11 +42,7 @@ def effective_semantic(
 ) -> EvaluationSemantic:
     """Computes the effective semantic of a specific contract assertion"""
 
-    module = inspect.getmodule(parent_frame)
-    info = ContractAssertionInfo(
-        kind=kind,
-        module_name=module.__name__ if module is not None else "",
-    )
+    info = __assertion_info(kind, __module_name(parent_frame))
     semantic: EvaluationSemantic = get_contract_evaluation_semantic(info)
     for label in labels:
         semantic = label(semantic, info)
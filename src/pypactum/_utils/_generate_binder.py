@@ -0,0 +1,130 @@
+import inspect
+from collections.abc import Callable, Sequence
+from types import FrameType
+from typing import Any
+
+from pypactum._utils._resolve_bindings import (
+    clone_binding,
+    resolve_outer_binding,
+)
+
+
+def __choose_prefix(names: list[str]) -> str:
+    """Returns a prefix for generated identifiers that doesn't clash with any of `names`"""
+
+    prefix = "_pactum_"
+    while any(n.startswith(prefix) for n in names):
+        prefix = "_" + prefix
+    return prefix
+
+
+def __parameter_list(
+    parameters: list[inspect.Parameter],
+    namespace: dict[str, Any],
+    prefix: str,
+) -> str:
+    """Generates the source of a parameter list equivalent to `parameters`. Defaults are stored in `namespace`."""
+
+    parts = []
+    has_var_positional = False
+    for i, param in enumerate(parameters):
+        part = param.name
+        match param.kind:
+            case inspect.Parameter.VAR_POSITIONAL:
+                part = f"*{param.name}"
+                has_var_positional = True
+            case inspect.Parameter.VAR_KEYWORD:
+                part = f"**{param.name}"
+            case inspect.Parameter.KEYWORD_ONLY if not has_var_positional:
+                parts.append("*")
+                has_var_positional = True
+        if param.default is not inspect.Parameter.empty:
+            default_name = f"{prefix}default_{i}"
+            namespace[default_name] = param.default
+            part += f"={default_name}"
+        parts.append(part)
+        if param.kind == inspect.Parameter.POSITIONAL_ONLY and (
+            i + 1 == len(parameters)
+            or parameters[i + 1].kind != inspect.Parameter.POSITIONAL_ONLY
+        ):
+            parts.append("/")
+    return ", ".join(parts)
+
+
+def generate_binder(
+    signature: inspect.Signature,
+    capture: dict[str, str],
+    clone: dict[str, str],
+    parent_frame: FrameType | None,
+    *,
+    qualname: str = "bind",
+    with_result: bool = False,
+    result_name: str | None = None,
+    positional: Sequence[str] | None = None,
+) -> Callable[..., Any]:
+    """Generates a function accepting the same arguments as `signature`, which resolves all captures and clones.
+
+    Names that refer to a parameter in `signature` are bound directly by the generated code, all others are resolved
+    from the locals and globals of `parent_frame` at call time. If `with_result` is True, the generated function takes
+    an additional leading positional argument, which is bound to `result_name` with the highest priority.
+
+    By default, the generated function returns a dict of all bindings. If `positional` is given, it returns a tuple of
+    the bindings named in `positional` instead, in that order.
+
+    Resolving a name that is not available raises TypeError.
+    """
+
+    parameters = list(signature.parameters.values())
+    param_names = {p.name for p in parameters}
+    prefix = __choose_prefix([p.name for p in parameters])
+    namespace: dict[str, Any] = {
+        f"{prefix}clone": clone_binding,
+        f"{prefix}resolve": resolve_outer_binding,
+    }
+    if with_result:
+        parameters.insert(
+            0,
+            inspect.Parameter(
+                f"{prefix}result", kind=inspect.Parameter.POSITIONAL_ONLY
+            ),
+        )
+
+    needs_scopes = False
+
+    def binding_source(name: str) -> str:
+        nonlocal needs_scopes
+        if with_result and name == result_name:
+            return f"{prefix}result"
+        if name in param_names:
+            return name
+        needs_scopes = True
+        return f"{prefix}resolve({prefix}locals, {prefix}globals, {name!r})"
+
+    sources = {k: binding_source(v) for k, v in capture.items()}
+    sources |= {k: f"{prefix}clone({binding_source(v)})" for k, v in clone.items()}
+    if positional is None:
+        result = f"{{{', '.join(f'{k!r}: {v}' for k, v in sources.items())}}}"
+    else:
+        result = f"({''.join(f'{sources[k]}, ' for k in positional)})"
+
+    lines = [f"def {prefix}bind({__parameter_list(parameters, namespace, prefix)}):"]
+    if needs_scopes:
+        if parent_frame is None:
+            namespace[f"{prefix}locals"] = {}
+            namespace[f"{prefix}globals"] = {}
+        elif parent_frame.f_code.co_flags & inspect.CO_OPTIMIZED:
+            # Only keep the frame alive if it's actually needed. The globals never change identity, but the locals of
+            # a function have to be fetched anew on every call to observe rebinding.
+            namespace[f"{prefix}frame"] = parent_frame
+            namespace[f"{prefix}globals"] = parent_frame.f_globals
+            lines.append(f"    {prefix}locals = {prefix}frame.f_locals")
+        else:
+            # Module and class bodies keep their locals in a regular dict, so the frame itself isn't needed
+            namespace[f"{prefix}locals"] = parent_frame.f_locals
+            namespace[f"{prefix}globals"] = parent_frame.f_globals
+    lines.append(f"    return {result}")
+
+    exec(compile("\n".join(lines), "<pactum-binder>", "exec"), namespace)
+    binder: Callable[..., Any] = namespace[f"{prefix}bind"]
+    binder.__qualname__ = qualname
+    return binder
@@ -0,0 +1,54 @@
+import inspect
+from collections.abc import Callable
+from types import FunctionType
+from typing import Any
+
+
+def __is_plain_function(func: Callable[..., Any]) -> bool:
+    """Returns whether the parameters of `func` are exactly those declared by its code object"""
+
+    return (
+        type(func) is FunctionType
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    )
+
+
+def parameter_names(func: Callable[..., Any]) -> tuple[str, ...]:
+    """Returns the names of all parameters of `func`.
+
+    For plain Python functions, the names are read from the code object directly. All other callables go through
+    `inspect.signature`.
+    """
+
+    if __is_plain_function(func):
+        code = func.__code__
+        count = code.co_argcount + code.co_kwonlyargcount
+        count += bool(code.co_flags & inspect.CO_VARARGS)
+        count += bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        return code.co_varnames[:count]
+    return tuple(inspect.signature(func).parameters.keys())
+
+
+def positional_parameter_names(func: Callable[..., Any]) -> tuple[str, ...] | None:
+    """Returns the names of all parameters of `func` if each of them accepts either a positional or a keyword argument.
+    Otherwise, returns None.
+    """
+
+    if __is_plain_function(func):
+        code = func.__code__
+        if (
+            code.co_posonlyargcount
+            or code.co_kwonlyargcount
+            or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        ):
+            return None
+        return code.co_varnames[: code.co_argcount]
+
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except ValueError:
+        return None
+    if all(p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD for p in parameters):
+        return tuple(p.name for p in parameters)
+    return None
@@ -1,9 +1,72 @@
-from types import FrameType
+import dis
+import functools
+import inspect
+from dataclasses import dataclass
+from itertools import islice
+from types import CodeType, FrameType
 
 
-def get_parent_frame(frame: FrameType | None) -> FrameType | None:
-    """If `frame` is not None, returns its parent frame. Otherwise, returns None."""
+@dataclass(frozen=True, slots=True)
+class FramePosition:
+    """The position a frame was executing at, from which its location information can be computed later"""
+
+    code: CodeType
+    instruction: int
+    lineno: int
+
+
+def get_frame_position(frame: FrameType | None) -> FramePosition | None:
+    """If `frame` is not None, returns the position it is currently executing at. Otherwise, returns None."""
 
     if frame is not None:
-        return frame.f_back
-    return frame
+        return FramePosition(frame.f_code, frame.f_lasti, frame.f_lineno)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def __location_info(
+    position: FramePosition,
+) -> tuple[str, int, tuple[str, ...] | None, int | None, dis.Positions]:
+    """Computes the location information for `position`, caching it so repeated violations don't hit the file system"""
+
+    code = position.code
+    positions: tuple[int | None, ...] = (None, None, None, None)
+    if position.instruction >= 0:
+        positions = next(islice(code.co_positions(), position.instruction // 2, None))
+    lineno = positions[0] if positions[0] is not None else position.lineno
+    positions = (lineno, *positions[1:])
+
+    filename = inspect.getsourcefile(code) or inspect.getfile(code)
+    context: tuple[str, ...] | None
+    index: int | None
+    try:
+        lines, _ = inspect.findsource(code)
+    except OSError:
+        context = index = None
+    else:
+        start = max(0, min(lineno - 1, len(lines) - 1))
+        context = tuple(lines[start : start + 1])
+        index = lineno - 1 - start
+
+    return filename, lineno, context, index, dis.Positions(*positions)
+
+
+def get_frame_location(position: FramePosition | None) -> inspect.Traceback | None:
+    """If `position` is not None, returns its location information like `inspect.getframeinfo`. Otherwise, returns None.
+
+    This reads the source file the first time a position is looked up, so it should only be called once the location
+    is actually needed.
+    """
+
+    if position is None:
+        return None
+
+    filename, lineno, context, index, positions = __location_info(position)
+    return inspect.Traceback(
+        filename,
+        lineno,
+        position.code.co_name,
+        list(context) if context is not None else None,
+        index,
+        positions=positions,
+    )
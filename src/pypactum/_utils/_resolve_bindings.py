@@ -1,31 +1,74 @@
-import copy
+from copy import deepcopy
+from collections.abc import Mapping
 from types import FrameType
 from typing import Any
 
+__immutable_types = (int, float, complex, str, bytes, bool, type(None))
+__unbound = object()
 
-def __resolve_binding(available_variables: list[dict[str, Any]], name: str) -> Any:
+
+def clone_binding(value: Any) -> Any:
+    """Returns a deep copy of `value`. Values of built-in immutable types are returned as-is.
+
+    Flat built-in containers of immutable values are copied shallowly, which is equivalent to but much faster than a
+    deep copy.
+    """
+
+    t = type(value)
+    if t in __immutable_types:
+        return value
+    if t is tuple or t is frozenset:
+        if all(type(v) in __immutable_types for v in value):
+            return value
+    elif t is list or t is set:
+        if all(type(v) in __immutable_types for v in value):
+            return value.copy()
+    elif t is dict:
+        if all(type(v) in __immutable_types for v in value.values()):
+            # Keys of built-in immutable types are all hashable, and hashable built-ins are immutable
+            if all(type(k) in __immutable_types for k in value):
+                return value.copy()
+    return deepcopy(value)
+
+
+def resolve_binding(available_variables: list[dict[str, Any]], name: str) -> Any:
     """Resolves a single binding and returns it. In case of error, raises TypeError."""
     for scope in available_variables:
-        if name in scope:
-            return scope[name]
+        value = scope.get(name, __unbound)
+        if value is not __unbound:
+            return value
     raise TypeError(f'Invalid binding "{name}"')
 
 
+def resolve_outer_binding(
+    local_variables: Mapping[str, Any],
+    global_variables: dict[str, Any],
+    name: str,
+) -> Any:
+    """Resolves a single binding from an outer scope and returns it. In case of error, raises TypeError."""
+
+    value = local_variables.get(name, __unbound)
+    if value is __unbound:
+        value = global_variables.get(name, __unbound)
+        if value is __unbound:
+            raise TypeError(f'Invalid binding "{name}"')
+    return value
+
+
 def resolve_bindings(
+    resolved: dict[str, Any],
     available_variables: list[dict[str, Any]],
     capture: dict[str, str],
     clone: dict[str, str],
-) -> dict[str, Any]:
-    """Resolves all captures and clones and returns them. In case of error, raises TypeError."""
+) -> None:
+    """Resolves all captures and clones into `resolved`, overwriting existing keys. In case of error, raises TypeError."""
 
-    referenced = {
-        k: __resolve_binding(available_variables, v) for k, v in capture.items()
-    }
-    cloned = {
-        k: copy.deepcopy(__resolve_binding(available_variables, v))
-        for k, v in clone.items()
-    }
-    return referenced | cloned
+    for k, v in capture.items():
+        # A clone of the same name takes precedence, so don't bother resolving it twice
+        if k not in clone:
+            resolved[k] = resolve_binding(available_variables, v)
+    for k, v in clone.items():
+        resolved[k] = clone_binding(resolve_binding(available_variables, v))
 
 
 def collect_available_variables(
@@ -34,7 +77,7 @@ def collect_available_variables(
 ) -> list[dict[str, Any]]:
     """Collects a list of all available variables, to be passed to resolve_bindings"""
 
-    candidate_bindings = [kwargs]
+    candidate_bindings = [kwargs] if kwargs else []
     if parent_frame is not None:
         candidate_bindings += [
             parent_frame.f_locals,
@@ -35,9 +35,10 @@ def log_on_contract_violation(
             return handler
 
         case logging.Logger() as log:
+            error = log.error
 
             def handler(violation: ContractViolation) -> None:
-                log.error(str(violation))
+                error(str(violation))
 
             return handler
 
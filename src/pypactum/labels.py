@@ -86,12 +86,20 @@ class filter_by_module:
             self.regex = re.compile(regex)
         else:
             self.regex = regex
+        self.__matches: dict[tuple[re.Pattern[str], str], bool] = {}
 
     def __call__(
         self,
         semantic: EvaluationSemantic,
         info: ContractAssertionInfo,
     ) -> EvaluationSemantic:
-        if self.regex.search(info.module_name) is None:
+        # Module names recur for every assertion in a module, so remember the outcome for each
+        key = (self.regex, info.module_name)
+        matches = self.__matches.get(key)
+        if matches is None:
+            matches = self.__matches[key] = (
+                self.regex.search(info.module_name) is not None
+            )
+        if not matches:
             return EvaluationSemantic.ignore
         return semantic
@@ -1,4 +1,5 @@
 import logging
+import typing
 
 import pytest
 
@@ -46,3 +47,8 @@ def test_logging_handler_logging(caplog):
         test()
 
         assert any("Precondition violation" in l.message for l in caplog.records)
+
+
+def test_logging_handler_type_hints():
+    hints = typing.get_type_hints(handlers.log_on_contract_violation)
+    assert logging.Logger in typing.get_args(hints["target"])
@@ -110,3 +110,22 @@ def test_invariant_as_context_manager():
     with invariant(lambda x: x == 42, capture={"x"}):
         x *= 2
         x -= 42
+
+
+def test_invariant_builtin_subclass():
+
+    @invariant(lambda self: True)
+    class Int(int):
+        pass
+
+    @invariant(lambda self: True)
+    class Str(str):
+        pass
+
+    @invariant(lambda self: True)
+    class Dict(dict):
+        pass
+
+    assert Int() == 0
+    assert Str() == ""
+    assert Dict() == {}
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 from pypactum import (
@@ -277,6 +280,13 @@ def test_post_as_context_manager():
     assert x == [3]
 
 
+def test_post_as_context_manager_ignored():
+    x = [42]
+    with post(lambda x: x.pop() == 42, capture_before={"x"}, labels=[labels.ignore]):
+        pass
+    assert x == [42]
+
+
 def test_post_as_context_manager_scope_regular_exit():
     x = [42]
 
@@ -343,3 +353,24 @@ def test_post_with_label():
                 pass
 
             test()
+
+
+def test_post_does_not_keep_frame_alive():
+
+    class Foo:
+        pass
+
+    def make_test():
+        foo = Foo()
+
+        @post(lambda result: result > 0)
+        def test(x):
+            return x
+
+        return test, weakref.ref(foo)
+
+    test, foo_ref = make_test()
+    gc.collect()
+
+    assert foo_ref() is None
+    assert test(1) == 1
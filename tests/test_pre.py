@@ -1,3 +1,6 @@
+import gc
+import inspect
+import weakref
 from warnings import deprecated
 
 import pytest
@@ -57,6 +60,20 @@ def test_pre_predicate_with_named_arguments():
         test(200, 200)
 
 
+def test_pre_predicate_violation_arguments():
+
+    @pre(lambda y, x: x < y)
+    def test(x, y):
+        pass
+
+    with pytest.raises(ContractViolationException) as exc_info:
+        test(2, 1)
+    assert exc_info.value.violation.kwargs == {"x": 2, "y": 1}
+    assert (
+        "@pre(lambda y, x: x < y)" in exc_info.value.violation.location.code_context[0]
+    )
+
+
 def test_pre_predicate_with_args():
 
     @pre(lambda args: len(args) > 0)
@@ -223,6 +240,29 @@ def test_pre_post_capture_with_other_decorator():
     test(42)
 
 
+def test_pre_post_preserve_signature():
+
+    def test(x: int, /, y: int = 1, *, z: int) -> int:
+        return x + y + z
+
+    checked = pre(lambda x: x > 0)(post(lambda result: result > 0)(test))
+
+    assert inspect.signature(checked) == inspect.signature(test)
+    assert checked(1, z=1) == 3
+
+
+def test_pre_post_unknown_signature():
+
+    checked_pre = pre(lambda x: x > 0)(max)
+    checked_post = post(lambda x: x > 0)(max)
+
+    with pytest.raises(ValueError):
+        checked_pre(1, 2)
+
+    with pytest.raises(ValueError):
+        checked_post(1, 2)
+
+
 def test_pre_capture_wrong_type():
 
     with pytest.raises(TypeError):
@@ -239,6 +279,13 @@ def test_pre_as_context_manager():
     assert x == [42]
 
 
+def test_pre_as_context_manager_ignored():
+    x = [42]
+    with pre(lambda x: x.pop() == 42, capture={"x"}, labels=[labels.ignore]):
+        pass
+    assert x == [42]
+
+
 def test_pre_post_as_context_manager():
     x = [42]
     with (
@@ -298,3 +345,24 @@ def test_pre_with_label():
                 pass
 
             test()
+
+
+def test_pre_does_not_keep_frame_alive():
+
+    class Foo:
+        pass
+
+    def make_test():
+        foo = Foo()
+
+        @pre(lambda x: x > 0)
+        def test(x):
+            return x
+
+        return test, weakref.ref(foo)
+
+    test, foo_ref = make_test()
+    gc.collect()
+
+    assert foo_ref() is None
+    assert test(1) == 1
@@ -0,0 +1,161 @@
+import inspect
+from types import FrameType
+
+import pytest
+
+from pypactum._utils._generate_binder import generate_binder
+
+
+def test_generate_binder_arguments():
+
+    def foo(f, /, g=2, *h, i, j=5, **k):
+        pass
+
+    sig = inspect.signature(foo)
+    bind = generate_binder(
+        sig, capture={n: n for n in sig.parameters.keys()}, clone={}, parent_frame=None
+    )
+
+    assert bind(1, i=4) == {"f": 1, "g": 2, "h": (), "i": 4, "j": 5, "k": {}}
+    assert bind(1, 3, 9, i=4, x=0) == {
+        "f": 1,
+        "g": 3,
+        "h": (9,),
+        "i": 4,
+        "j": 5,
+        "k": {"x": 0},
+    }
+
+    with pytest.raises(TypeError):
+        bind(i=4)
+
+    with pytest.raises(TypeError):
+        bind(1)
+
+    with pytest.raises(TypeError):
+        bind(f=1, i=4)
+
+
+def test_generate_binder_keyword_only():
+
+    def foo(f, *, g):
+        pass
+
+    bind = generate_binder(
+        inspect.signature(foo), capture={"x": "g"}, clone={}, parent_frame=None
+    )
+
+    assert bind(1, g=2) == {"x": 2}
+
+    with pytest.raises(TypeError):
+        bind(1, 2)
+
+
+def test_generate_binder_clone():
+
+    def foo(f):
+        pass
+
+    bind = generate_binder(
+        inspect.signature(foo), capture={}, clone={"f": "f"}, parent_frame=None
+    )
+
+    x = [1]
+    assert bind(x) == {"f": [1]}
+    assert bind(x)["f"] is not x
+
+
+def test_generate_binder_outer_scope():
+
+    def foo():
+        pass
+
+    x = 42
+    bind = generate_binder(
+        inspect.signature(foo),
+        capture={"x": "x"},
+        clone={},
+        parent_frame=inspect.currentframe(),
+    )
+
+    assert bind() == {"x": 42}
+    x = 43
+    assert bind() == {"x": 43}
+
+    bind = generate_binder(
+        inspect.signature(foo), capture={"y": "y"}, clone={}, parent_frame=None
+    )
+
+    with pytest.raises(TypeError):
+        bind()
+
+
+def test_generate_binder_module_scope():
+
+    def foo():
+        pass
+
+    scope = {}
+    exec("import inspect\nframe = inspect.currentframe()\nx = 42", scope)
+    bind = generate_binder(
+        inspect.signature(foo),
+        capture={"x": "x"},
+        clone={},
+        parent_frame=scope.pop("frame"),
+    )
+
+    assert not any(isinstance(v, FrameType) for v in bind.__globals__.values())
+    assert bind() == {"x": 42}
+    scope["x"] = 43
+    assert bind() == {"x": 43}
+
+
+def test_generate_binder_result():
+
+    def foo(x):
+        pass
+
+    bind = generate_binder(
+        inspect.signature(foo),
+        capture={"result": "result", "x": "x"},
+        clone={},
+        parent_frame=None,
+        with_result=True,
+        result_name="result",
+    )
+
+    assert bind(42, 1) == {"result": 42, "x": 1}
+
+
+def test_generate_binder_name_clash():
+
+    def foo(_pactum_deepcopy, _pactum_result):
+        pass
+
+    bind = generate_binder(
+        inspect.signature(foo),
+        capture={"x": "_pactum_deepcopy"},
+        clone={"y": "_pactum_result"},
+        parent_frame=None,
+        with_result=True,
+    )
+
+    assert bind(0, 1, [2]) == {"x": 1, "y": [2]}
+
+
+def test_generate_binder_positional():
+
+    def foo(f, g):
+        pass
+
+    bind = generate_binder(
+        inspect.signature(foo),
+        capture={"x": "g"},
+        clone={"y": "f"},
+        parent_frame=None,
+        positional=["x", "y"],
+    )
+
+    y = [1]
+    assert bind(y, 2) == (2, [1])
+    assert bind(y, 2)[1] is not y
@@ -0,0 +1,59 @@
+import functools
+
+from pypactum._utils._parameter_names import (
+    parameter_names,
+    positional_parameter_names,
+)
+
+
+def test_parameter_names_function():
+
+    def foo(a, /, b, *c, d, e=5, **f):
+        x = 1
+        return x
+
+    assert parameter_names(foo) == ("a", "b", "d", "e", "c", "f")
+    assert parameter_names(lambda: True) == ()
+    assert parameter_names(lambda x, y: True) == ("x", "y")
+
+
+def test_parameter_names_other_callables():
+
+    def foo(a, b):
+        pass
+
+    @functools.wraps(foo)
+    def wrapper(*args, **kwargs):
+        pass
+
+    class Foo:
+        def bar(self, a):
+            pass
+
+    assert parameter_names(wrapper) == ("a", "b")
+    assert parameter_names(functools.partial(foo, 1)) == ("b",)
+    assert parameter_names(Foo().bar) == ("a",)
+
+
+def test_positional_parameter_names():
+
+    assert positional_parameter_names(lambda: True) == ()
+    assert positional_parameter_names(lambda y, x=1: True) == ("y", "x")
+    assert positional_parameter_names(lambda x, /: True) is None
+    assert positional_parameter_names(lambda *x: True) is None
+    assert positional_parameter_names(lambda *, x: True) is None
+    assert positional_parameter_names(lambda **x: True) is None
+
+
+def test_positional_parameter_names_other_callables():
+
+    def foo(a, b):
+        pass
+
+    @functools.wraps(foo)
+    def wrapper(*args, **kwargs):
+        pass
+
+    assert positional_parameter_names(wrapper) == ("a", "b")
+    assert positional_parameter_names(functools.partial(foo, 1)) == ("b",)
+    assert positional_parameter_names(functools.partial(foo, b=1)) is None
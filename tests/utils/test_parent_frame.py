@@ -0,0 +1,24 @@
+import inspect
+
+from pypactum._utils._parent_frame import get_frame_location, get_frame_position
+
+
+def test_get_frame_location():
+    frame = inspect.currentframe()
+    position, expected = get_frame_position(frame), inspect.getframeinfo(frame)
+    location = get_frame_location(position)
+
+    assert location.filename == expected.filename
+    assert location.lineno == expected.lineno
+    assert location.function == expected.function
+    assert location.code_context == expected.code_context
+    assert location.index == expected.index
+
+    again = get_frame_location(position)
+    assert again == location
+    assert again.code_context is not location.code_context
+
+
+def test_get_frame_location_none():
+    assert get_frame_position(None) is None
+    assert get_frame_location(None) is None
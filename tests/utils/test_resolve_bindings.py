@@ -0,0 +1,61 @@
+import pytest
+
+from pypactum._utils._resolve_bindings import (
+    clone_binding,
+    resolve_bindings,
+    resolve_outer_binding,
+)
+
+
+def test_clone_binding_immutable():
+    for value in [42, 4.2, "foo", b"bar", True, None, (1, "x")]:
+        assert clone_binding(value) is value
+
+
+def test_clone_binding_mutable():
+    for value in [[42], {"x": 1}, {1, 2}, ([1], 2)]:
+        cloned = clone_binding(value)
+        assert cloned == value
+        assert cloned is not value
+
+
+def test_clone_binding_nested():
+    for value in [[[42]], {"x": [1]}, {(1,): [2]}, frozenset({(1, 2)})]:
+        cloned = clone_binding(value)
+        assert cloned == value
+        if isinstance(value, dict):
+            assert all(cloned[k] is not value[k] for k in value)
+        elif not isinstance(value, frozenset):
+            assert cloned[0] is not value[0]
+
+
+def test_resolve_bindings():
+    x = [1]
+    scopes = [{"x": x}, {"y": 2}]
+
+    def resolve(capture, clone):
+        resolved = {}
+        resolve_bindings(resolved, scopes, capture=capture, clone=clone)
+        return resolved
+
+    assert resolve(capture={}, clone={}) == {}
+    assert resolve(capture={"a": "x"}, clone={})["a"] is x
+    assert resolve(capture={}, clone={"a": "x"})["a"] is not x
+    assert resolve(capture={"a": "y"}, clone={"b": "x"}) == {"a": 2, "b": [1]}
+    assert resolve(capture={"a": "x"}, clone={"a": "x"})["a"] is not x
+
+    resolved = {"a": 0, "c": 3}
+    resolve_bindings(resolved, scopes, capture={"a": "y"}, clone={})
+    assert resolved == {"a": 2, "c": 3}
+
+
+def test_resolve_outer_binding():
+    local_variables = {"x": 1, "z": None}
+    global_variables = {"x": 2, "y": 3}
+
+    assert resolve_outer_binding(local_variables, global_variables, "x") == 1
+    assert resolve_outer_binding(local_variables, global_variables, "y") == 3
+    assert resolve_outer_binding(local_variables, global_variables, "z") is None
+
+    with pytest.raises(TypeError):
+        resolve_outer_binding(local_variables, global_variables, "w")